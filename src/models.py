@@ -27,7 +27,7 @@ class EpisodeType(IntEnum):
     OTHER = 5  # O prefix
 
 
-@dataclass
+@dataclass(slots=True)
 class WatchedEpisode:
     """A watched episode with its watch date."""
 
@@ -38,7 +38,7 @@ class WatchedEpisode:
     @property
     def is_special(self) -> bool:
         """Check if this is a special episode (not regular)."""
-        return self.episode_type != EpisodeType.REGULAR
+        return self.episode_type is not EpisodeType.REGULAR
 
     @property
     def display_number(self) -> str:
@@ -54,7 +54,7 @@ def display_number(self) -> str:
         return f"{prefixes[self.episode_type]}{self.episode_number}"
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimeRating:
     """User rating for an anime."""
 
@@ -63,7 +63,7 @@ class AnimeRating:
     is_temporary: bool = False  # True if from MyTempVote
 
 
-@dataclass
+@dataclass(slots=True)
 class MappedIds:
     """Trakt-compatible IDs for an anime."""
 
@@ -77,14 +77,7 @@ class MappedIds:
     @property
     def has_any_id(self) -> bool:
         """Check if any ID is available."""
-        return any(
-            [
-                self.tvdb_id,
-                self.imdb_id,
-                self.tmdb_show_id,
-                self.tmdb_movie_id,
-            ]
-        )
+        return bool(self.tvdb_id or self.imdb_id or self.tmdb_show_id or self.tmdb_movie_id)
 
     @property
     def is_movie(self) -> bool:
@@ -105,7 +98,7 @@ def get_trakt_ids(self) -> dict:
         return ids
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimeEntry:
     """A complete anime entry from AniDB export."""
 
@@ -150,12 +143,12 @@ def is_mapped(self) -> bool:
     @property
     def is_movie(self) -> bool:
         """Check if this is a movie."""
-        if self.anime_type == AnimeType.MOVIE:
+        if self.anime_type is AnimeType.MOVIE:
             return True
         return bool(self.mapped_ids and self.mapped_ids.is_movie)
 
 
-@dataclass
+@dataclass(slots=True)
 class TraktEntry:
     """An existing entry from Trakt for comparison."""
 
@@ -168,7 +161,14 @@ class TraktEntry:
     is_movie: bool = False
 
 
-@dataclass
+# Report indicators for rating conflicts, keyed by keep_anidb_rating
+_CONFLICT_INDICATORS = {
+    True: "✅ Keep AniDB",
+    False: "⏭️ Keep Trakt",
+}
+
+
+@dataclass(slots=True)
 class ConflictResolution:
     """Result of comparing AniDB and Trakt data."""
 
@@ -199,12 +199,10 @@ def conflict_indicator(self) -> str:
             return "➕ New"
         if not self.rating_conflict:
             return "✅ No conflict"
-        if self.keep_anidb_rating:
-            return "✅ Keep AniDB"
-        return "⏭️ Keep Trakt"
+        return _CONFLICT_INDICATORS[bool(self.keep_anidb_rating)]
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncCheckpoint:
     """Checkpoint for resumable syncs."""
 
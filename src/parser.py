@@ -1,10 +1,13 @@
 """AniDB XML export parser supporting multiple export formats."""
 
 import logging
+import re
 import xml.etree.ElementTree as ET
 from collections.abc import Iterator
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import BinaryIO
 
 from .models import (
     AnimeEntry,
@@ -16,6 +19,9 @@
 
 logger = logging.getLogger(__name__)
 
+# iterparse reads in 16 KiB chunks; a larger buffer cuts read syscalls on big exports
+_READ_BUFFER_SIZE = 128 * 1024
+
 
 class AniDBParseError(Exception):
     """Error parsing AniDB export file."""
@@ -23,6 +29,12 @@ class AniDBParseError(Exception):
     pass
 
 
+# AniDB date layout: DD.MM.YYYY with optional HH:MM
+_ANIDB_DATE_RE = re.compile(
+    r"([0-9]{1,2})\.([0-9]{1,2})\.([0-9]{4})(?:\s+([0-9]{1,2}):([0-9]{1,2}))?"
+)
+
+
 def parse_anidb_date(date_str: str | None) -> datetime | None:
     """Parse AniDB date format: DD.MM.YYYY HH:MM or DD.MM.YYYY.
 
@@ -38,20 +50,23 @@ def parse_anidb_date(date_str: str | None) -> datetime | None:
     date_str = date_str.strip()
 
     # Skip placeholder values
-    if date_str in ("-", ""):
+    if date_str == "-":
         return None
 
-    # Try with time first: DD.MM.YYYY HH:MM
-    try:
-        return datetime.strptime(date_str, "%d.%m.%Y %H:%M")
-    except ValueError:
-        pass
+    return _parse_anidb_date_cached(date_str)
 
-    # Try without time: DD.MM.YYYY
-    try:
-        return datetime.strptime(date_str, "%d.%m.%Y")
-    except ValueError:
-        pass
+
+@lru_cache(maxsize=4096)
+def _parse_anidb_date_cached(date_str: str) -> datetime | None:
+    """Parse a stripped AniDB date string (cached, exports repeat view dates a lot)."""
+    # Build the datetime from the regex groups directly; strptime is much slower
+    match = _ANIDB_DATE_RE.fullmatch(date_str)
+    if match:
+        day, month, year, hour, minute = match.groups(default="0")
+        try:
+            return datetime(int(year), int(month), int(day), int(hour), int(minute))
+        except ValueError:
+            return None
 
     # Try ISO format as fallback: YYYY-MM-DD
     try:
@@ -62,6 +77,16 @@ def parse_anidb_date(date_str: str | None) -> datetime | None:
     return None
 
 
+# Episode number prefixes (no prefix means a regular episode)
+_EPISODE_PREFIXES = {
+    "S": EpisodeType.SPECIAL,
+    "C": EpisodeType.CREDITS,
+    "T": EpisodeType.TRAILER,
+    "P": EpisodeType.PARODY,
+    "O": EpisodeType.OTHER,
+}
+
+
 def parse_episode_number(ep_str: str) -> tuple[int, EpisodeType]:
     """Parse episode number string with optional prefix.
 
@@ -74,29 +99,21 @@ def parse_episode_number(ep_str: str) -> tuple[int, EpisodeType]:
     Raises:
         ValueError: If the episode string cannot be parsed.
     """
-    ep_str = ep_str.strip().upper()
-
-    prefix_map = {
-        "S": EpisodeType.SPECIAL,
-        "C": EpisodeType.CREDITS,
-        "T": EpisodeType.TRAILER,
-        "P": EpisodeType.PARODY,
-        "O": EpisodeType.OTHER,
-    }
-
-    # Check for prefix
-    if ep_str and ep_str[0] in prefix_map:
-        prefix = ep_str[0]
-        num_str = ep_str[1:]
-        if not num_str.isdigit():
-            raise ValueError(f"Invalid episode number: {ep_str}")
-        return int(num_str), prefix_map[prefix]
-
-    # Regular episode
-    if not ep_str.isdigit():
+    ep_str = ep_str.strip()
+
+    # Single dict probe on the first character decides the episode type
+    ep_type = _EPISODE_PREFIXES.get(ep_str[:1].upper())
+    num_str = ep_str[1:] if ep_type is not None else ep_str
+
+    # ASCII digits only; isdigit() alone also accepts digits from other scripts
+    if not (num_str.isascii() and num_str.isdigit()):
         raise ValueError(f"Invalid episode number: {ep_str}")
 
-    return int(ep_str), EpisodeType.REGULAR
+    return int(num_str), ep_type if ep_type is not None else EpisodeType.REGULAR
+
+
+# AniDB type code string -> AnimeType
+_ANIME_TYPES = {str(anime_type.value): anime_type for anime_type in AnimeType}
 
 
 def get_anime_type(type_code: str | None) -> AnimeType:
@@ -108,12 +125,16 @@ def get_anime_type(type_code: str | None) -> AnimeType:
     Returns:
         AnimeType enum value.
     """
+    anime_type = _ANIME_TYPES.get(type_code)
+    if anime_type is not None:
+        return anime_type
+
+    # Non-canonical codes ("02", " 4") fall back to int() parsing
     if not type_code:
         return AnimeType.UNKNOWN
 
     try:
-        code = int(type_code)
-        return AnimeType(code)
+        return AnimeType(int(type_code))
     except (ValueError, KeyError):
         return AnimeType.UNKNOWN
 
@@ -138,22 +159,29 @@ def _get_int(element: ET.Element | None, default: int = 0) -> int:
         return default
 
 
-def _detect_format(root: ET.Element) -> str:
-    """Detect the export format from root element.
+def _get_english_title(anime_elem: ET.Element, title: str) -> str | None:
+    """Get the English title, sharing the romaji title object when they are equal."""
+    title_english = _get_text(anime_elem.find("NameEnglish"))
+    if not title_english:
+        return None
+    # Many entries repeat the main title here; keep one string instead of two
+    return title if title_english == title else title_english
+
+
+def _detect_format(root_tag: str, first_anime_tag: str | None = None) -> str:
+    """Detect the export format from the root tag (or the first anime element tag).
 
     Returns:
         'singlefile' for xml-singlefile-dataonly
         'plain-new' for xml-plain-new
     """
-    if root.tag == "my_anime_list":
+    if root_tag == "my_anime_list":
         return "singlefile"
-    if root.tag == "MyList":
+    if root_tag == "MyList":
         return "plain-new"
-    # Check for lowercase anime elements (singlefile format)
-    if root.find("anime") is not None:
+    # Lowercase anime elements indicate the singlefile format
+    if first_anime_tag == "anime":
         return "singlefile"
-    if root.find("Anime") is not None:
-        return "plain-new"
     return "plain-new"  # Default
 
 
@@ -174,7 +202,7 @@ def _parse_anime_plain_new(anime_elem: ET.Element) -> AnimeEntry | None:
         return None
 
     title = _get_text(anime_elem.find("Name"), f"Unknown Anime {anidb_id}")
-    title_english = _get_text(anime_elem.find("NameEnglish")) or None
+    title_english = _get_english_title(anime_elem, title)
     anime_type = get_anime_type(_get_text(anime_elem.find("Type")))
     total_episodes = _get_int(anime_elem.find("EpisodeCount"))
     total_specials = _get_int(anime_elem.find("SpecialCount"))
@@ -261,44 +289,48 @@ def _get_earliest_view_date_plain_new(ep_elem: ET.Element) -> datetime | None:
 # =============================================================================
 
 
-def _parse_singlefile_format(root: ET.Element) -> list[AnimeEntry]:
-    """Parse xml-singlefile-dataonly format.
+def _parse_episode_singlefile(ep_elem: ET.Element, episode_map: dict[int, tuple[int, str]]) -> None:
+    """Record an episode element (EpID -> (AnimeID, EpNo)) from singlefile format."""
+    ep_id = _get_int(ep_elem.find("EpID"))
+    anime_id = _get_int(ep_elem.find("AnimeID"))
+    ep_no = _get_text(ep_elem.find("EpNo"))
+    if ep_id and anime_id and ep_no:
+        episode_map[ep_id] = (anime_id, ep_no)
+
+
+def _parse_file_singlefile(
+    file_elem: ET.Element, watched_files: list[tuple[int, int, datetime | None]]
+) -> None:
+    """Record a watched file element (AnimeID, EpID, ViewDate) from singlefile format."""
+    if _get_text(file_elem.find("MyWatched")) != "1":
+        return
+
+    watched_files.append(
+        (
+            _get_int(file_elem.find("AnimeID")),
+            _get_int(file_elem.find("EpID")),
+            parse_anidb_date(_get_text(file_elem.find("ViewDate"))),
+        )
+    )
+
+
+def _join_singlefile(
+    anime_map: dict[int, AnimeEntry],
+    episode_map: dict[int, tuple[int, str]],
+    watched_files: list[tuple[int, int, datetime | None]],
+) -> list[AnimeEntry]:
+    """Join xml-singlefile-dataonly sections into anime entries.
 
     This format has separate sections for anime, episodes, and files.
-    We need to join them together.
+    Watched files are assigned to their anime via the episode lookup.
     """
-    # Step 1: Parse all anime entries
-    anime_map: dict[int, AnimeEntry] = {}
-    for anime_elem in root.findall("anime"):
-        entry = _parse_anime_singlefile(anime_elem)
-        if entry:
-            anime_map[entry.anidb_id] = entry
-
     logger.debug(f"Parsed {len(anime_map)} anime entries")
-
-    # Step 2: Build episode lookup (EpID -> (AnimeID, EpNo))
-    episode_map: dict[int, tuple[int, str]] = {}
-    for ep_elem in root.findall("episode"):
-        ep_id = _get_int(ep_elem.find("EpID"))
-        anime_id = _get_int(ep_elem.find("AnimeID"))
-        ep_no = _get_text(ep_elem.find("EpNo"))
-        if ep_id and anime_id and ep_no:
-            episode_map[ep_id] = (anime_id, ep_no)
-
     logger.debug(f"Parsed {len(episode_map)} episode entries")
 
-    # Step 3: Parse files and assign watched episodes to anime
-    watched_files = 0
-    for file_elem in root.findall("file"):
-        my_watched = _get_text(file_elem.find("MyWatched"))
-        if my_watched != "1":
-            continue
-
-        watched_files += 1
-        anime_id = _get_int(file_elem.find("AnimeID"))
-        ep_id = _get_int(file_elem.find("EpID"))
-        view_date = parse_anidb_date(_get_text(file_elem.find("ViewDate")))
+    # (AnimeID, episode type, episode number) -> episode, keeping the earliest view date
+    seen: dict[tuple[int, EpisodeType, int], WatchedEpisode] = {}
 
+    for anime_id, ep_id, view_date in watched_files:
         if anime_id not in anime_map:
             continue
 
@@ -313,30 +345,23 @@ def _parse_singlefile_format(root: ET.Element) -> list[AnimeEntry]:
         except ValueError:
             continue
 
-        # Add or update watched episode
-        anime = anime_map[anime_id]
-
-        # Find existing episode or create new
-        existing_ep = None
-        for ep in anime.watched_episodes:
-            if ep.episode_type == ep_type and ep.episode_number == ep_number:
-                existing_ep = ep
-                break
+        key = (anime_id, ep_type, ep_number)
+        existing_ep = seen.get(key)
 
         if existing_ep:
             # Use earliest view date
             if view_date and (existing_ep.watched_at is None or view_date < existing_ep.watched_at):
                 existing_ep.watched_at = view_date
         else:
-            anime.watched_episodes.append(
-                WatchedEpisode(
-                    episode_number=ep_number,
-                    episode_type=ep_type,
-                    watched_at=view_date,
-                )
+            episode = WatchedEpisode(
+                episode_number=ep_number,
+                episode_type=ep_type,
+                watched_at=view_date,
             )
+            seen[key] = episode
+            anime_map[anime_id].watched_episodes.append(episode)
 
-    logger.debug(f"Processed {watched_files} watched files")
+    logger.debug(f"Processed {len(watched_files)} watched files")
 
     return list(anime_map.values())
 
@@ -348,7 +373,7 @@ def _parse_anime_singlefile(anime_elem: ET.Element) -> AnimeEntry | None:
         return None
 
     title = _get_text(anime_elem.find("Name"), f"Unknown Anime {anidb_id}")
-    title_english = _get_text(anime_elem.find("NameEnglish")) or None
+    title_english = _get_english_title(anime_elem, title)
 
     # TypeID instead of Type
     anime_type = get_anime_type(_get_text(anime_elem.find("TypeID")))
@@ -405,6 +430,58 @@ def _parse_rating(anime_elem: ET.Element) -> AnimeRating | None:
     return AnimeRating(score=score, rated_at=rated_at, is_temporary=is_temp)
 
 
+def _parse_stream(source: BinaryIO) -> tuple[str, list[AnimeEntry]]:
+    """Parse an export incrementally, discarding elements once processed.
+
+    Returns:
+        Tuple of (format, entries).
+    """
+    context = ET.iterparse(source, events=("start", "end"))
+    _, root = next(context)
+
+    first_anime_tag: str | None = None
+    plain_entries: list[AnimeEntry] = []
+    anime_map: dict[int, AnimeEntry] = {}
+    episode_map: dict[int, tuple[int, str]] = {}
+    watched_files: list[tuple[int, int, datetime | None]] = []
+    depth = 0
+
+    for event, elem in context:
+        if event == "start":
+            depth += 1
+            continue
+
+        depth -= 1
+        tag = elem.tag
+
+        if tag == "Anime":
+            # xml-plain-new: anime may be nested, so handle at any depth
+            first_anime_tag = first_anime_tag or tag
+            entry = _parse_anime_plain_new(elem)
+            if entry:
+                plain_entries.append(entry)
+            elem.clear()
+        elif depth == 0:
+            # xml-singlefile-dataonly sections are direct children of the root
+            if tag == "anime":
+                first_anime_tag = first_anime_tag or tag
+                entry = _parse_anime_singlefile(elem)
+                if entry:
+                    anime_map[entry.anidb_id] = entry
+            elif tag == "episode":
+                _parse_episode_singlefile(elem, episode_map)
+            elif tag == "file":
+                _parse_file_singlefile(elem, watched_files)
+
+        if depth == 0:
+            root.clear()
+
+    file_format = _detect_format(root.tag, first_anime_tag)
+    if file_format == "singlefile":
+        return file_format, _join_singlefile(anime_map, episode_map, watched_files)
+    return file_format, plain_entries
+
+
 class AniDBParser:
     """Parser for AniDB XML export files.
 
@@ -420,7 +497,7 @@ def __init__(self, file_path: str | Path):
             file_path: Path to the AniDB export XML file.
         """
         self.file_path = Path(file_path)
-        if not self.file_path.exists():
+        if not self.file_path.is_file():
             raise AniDBParseError(f"File not found: {self.file_path}")
 
         self._format: str | None = None
@@ -439,28 +516,13 @@ def parse(self) -> list[AnimeEntry]:
             return self._entries
 
         try:
-            tree = ET.parse(self.file_path)
-            root = tree.getroot()
+            with open(self.file_path, "rb", buffering=_READ_BUFFER_SIZE) as f:
+                self._format, self._entries = _parse_stream(f)
         except ET.ParseError as e:
             raise AniDBParseError(f"Failed to parse XML: {e}") from e
 
-        self._format = _detect_format(root)
         logger.info(f"Detected export format: {self._format}")
 
-        if self._format == "singlefile":
-            self._entries = _parse_singlefile_format(root)
-        else:
-            # xml-plain-new format
-            anime_list = root.findall(".//Anime")
-            if not anime_list:
-                anime_list = root.findall("Anime")
-
-            self._entries = []
-            for anime_elem in anime_list:
-                entry = _parse_anime_plain_new(anime_elem)
-                if entry:
-                    self._entries.append(entry)
-
         return self._entries
 
     def iter_anime(self) -> Iterator[AnimeEntry]:
@@ -480,13 +542,11 @@ def get_watched_anime(self, exclude_hentai: bool = False) -> list[AnimeEntry]:
         Returns:
             List of watched anime entries.
         """
-        watched = []
-        for entry in self.parse():
-            if exclude_hentai and entry.is_hentai:
-                continue
-            if entry.watched_episodes or entry.rating:
-                watched.append(entry)
-        return watched
+        return [
+            entry
+            for entry in self.parse()
+            if (entry.watched_episodes or entry.rating) and not (exclude_hentai and entry.is_hentai)
+        ]
 
     def get_stats(self) -> dict:
         """Get statistics about the export.
@@ -496,14 +556,23 @@ def get_stats(self) -> dict:
         """
         entries = self.parse()
 
-        total = len(entries)
-        with_ratings = sum(1 for e in entries if e.rating)
-        with_watched = sum(1 for e in entries if e.watched_episodes)
-        total_watched_eps = sum(len(e.watched_episodes) for e in entries)
-        hentai_count = sum(1 for e in entries if e.is_hentai)
+        with_ratings = 0
+        with_watched = 0
+        total_watched_eps = 0
+        hentai_count = 0
+
+        # Single pass over the entries for all counters
+        for e in entries:
+            if e.rating:
+                with_ratings += 1
+            if e.watched_episodes:
+                with_watched += 1
+                total_watched_eps += len(e.watched_episodes)
+            if e.is_hentai:
+                hentai_count += 1
 
         return {
-            "total_anime": total,
+            "total_anime": len(entries),
             "with_ratings": with_ratings,
             "with_watched_episodes": with_watched,
             "total_watched_episodes": total_watched_eps,
@@ -2,7 +2,9 @@
 
 import csv
 import html
+import json
 import logging
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 
@@ -365,6 +367,10 @@ def _generate_links(anime: AnimeEntry) -> dict[str, str]:
 """
 
 
+# Template halves around the table rows, so the rows are not substituted via format()
+_HTML_HEAD, _HTML_TAIL = HTML_TEMPLATE.split("{table_rows}")
+
+
 def _rating_class(score: int | None) -> str:
     """Get CSS class for rating display."""
     if score is None:
@@ -376,6 +382,75 @@ def _rating_class(score: int | None) -> str:
     return "rating-low"
 
 
+def _render_html_row(anime: AnimeEntry, resolution: ConflictResolution | None) -> str:
+    """Render a single table row for the HTML report."""
+    links = _generate_links(anime)
+    status = _get_status_indicator(anime, resolution)
+
+    # AniDB rating
+    anidb_score = None
+    anidb_rating = "-"
+    anidb_rating_date = ""
+    if anime.rating:
+        anidb_score = anime.rating.score
+        anidb_rating = str(anidb_score)
+        anidb_rating_date = f" ({_format_date(anime.rating.rated_at)})"
+
+    # Trakt rating (from resolution)
+    trakt_score = None
+    trakt_rating = "-"
+    trakt_rating_date = ""
+    if resolution and resolution.trakt_entry and resolution.trakt_entry.rating:
+        trakt_score = resolution.trakt_entry.rating
+        trakt_rating = str(trakt_score)
+        trakt_rating_date = f" ({_format_date(resolution.trakt_entry.rated_at)})"
+
+    # Conflict indicator
+    conflict = "-"
+    has_conflict = False
+    if resolution and resolution.has_rating_conflict:
+        conflict = resolution.conflict_indicator
+        has_conflict = True
+    elif resolution and resolution.is_new and anime.rating:
+        conflict = "➕ New"
+
+    # Episode count
+    watched = anime.watched_count
+    total = anime.total_episodes
+    ep_display = f"{watched}/{total}" if total > 0 else str(watched)
+
+    # Build links HTML
+    links_html = " ".join(
+        f'<a href="{html.escape(url)}" target="_blank">{name}</a>' for name, url in links.items()
+    )
+
+    # Status class
+    if "Unmapped" in status:
+        status_class = "status-unmapped"
+    elif "New" in status:
+        status_class = "status-new"
+    else:
+        status_class = "status-mapped"
+
+    return f"""<tr data-mapped="{"true" if anime.is_mapped else "false"}"
+                      data-conflict="{"true" if has_conflict else "false"}"
+                      data-rated="{"true" if anime.rating else "false"}">
+            <td>{html.escape(anime.display_title)}</td>
+            <td>{anime.anime_type.name}</td>
+            <td data-sort="{-1 if anidb_score is None else anidb_score}"
+                class="rating {_rating_class(anidb_score)}">
+                {anidb_rating}{anidb_rating_date}
+            </td>
+            <td data-sort="{-1 if trakt_score is None else trakt_score}">
+                {trakt_rating}{trakt_rating_date}
+            </td>
+            <td>{conflict}</td>
+            <td data-sort="{watched}">{ep_display}</td>
+            <td class="links">{links_html}</td>
+            <td class="{status_class}">{status}</td>
+        </tr>"""
+
+
 def generate_html_report(
     anime_list: list[AnimeEntry],
     resolutions: list[ConflictResolution] | None = None,
@@ -404,82 +479,23 @@ def generate_html_report(
     with_ratings = sum(1 for a in anime_list if a.rating)
     conflicts_count = sum(1 for r in (resolutions or []) if r.has_rating_conflict)
 
-    # Generate table rows
-    rows = []
-    for anime in sorted(anime_list, key=lambda a: a.display_title.lower()):
-        resolution = resolution_map.get(anime.anidb_id)
-        links = _generate_links(anime)
-        status = _get_status_indicator(anime, resolution)
-
-        # AniDB rating
-        anidb_rating = "-"
-        anidb_rating_date = ""
-        if anime.rating:
-            anidb_rating = str(anime.rating.score)
-            anidb_rating_date = f" ({_format_date(anime.rating.rated_at)})"
-
-        # Trakt rating (from resolution)
-        trakt_rating = "-"
-        trakt_rating_date = ""
-        if resolution and resolution.trakt_entry and resolution.trakt_entry.rating:
-            trakt_rating = str(resolution.trakt_entry.rating)
-            trakt_rating_date = f" ({_format_date(resolution.trakt_entry.rated_at)})"
-
-        # Conflict indicator
-        conflict = "-"
-        has_conflict = False
-        if resolution and resolution.has_rating_conflict:
-            conflict = resolution.conflict_indicator
-            has_conflict = True
-        elif resolution and resolution.is_new and anime.rating:
-            conflict = "➕ New"
-
-        # Episode count
-        watched = anime.watched_count
-        total = anime.total_episodes
-        ep_display = f"{watched}/{total}" if total > 0 else str(watched)
-
-        # Build links HTML
-        links_html = []
-        for name, url in links.items():
-            links_html.append(f'<a href="{html.escape(url)}" target="_blank">{name}</a>')
-
-        # Status class
-        if "Unmapped" in status:
-            status_class = "status-unmapped"
-        elif "New" in status:
-            status_class = "status-new"
-        else:
-            status_class = "status-mapped"
-
-        row = f"""<tr data-mapped="{"true" if anime.is_mapped else "false"}"
-                      data-conflict="{"true" if has_conflict else "false"}"
-                      data-rated="{"true" if anime.rating else "false"}">
-            <td>{html.escape(anime.display_title)}</td>
-            <td>{anime.anime_type.name}</td>
-            <td data-sort="{anime.rating.score if anime.rating else -1}"
-                class="rating {_rating_class(anime.rating.score if anime.rating else None)}">
-                {anidb_rating}{anidb_rating_date}
-            </td>
-            <td data-sort="{resolution.trakt_entry.rating if resolution and resolution.trakt_entry and resolution.trakt_entry.rating else -1}">
-                {trakt_rating}{trakt_rating_date}
-            </td>
-            <td>{conflict}</td>
-            <td data-sort="{watched}">{ep_display}</td>
-            <td class="links">{" ".join(links_html)}</td>
-            <td class="{status_class}">{status}</td>
-        </tr>"""
-        rows.append(row)
-
-    # Generate HTML
-    html_content = HTML_TEMPLATE.format(
-        total_count=total_count,
-        mapped_count=mapped_count,
-        unmapped_count=unmapped_count,
-        with_ratings=with_ratings,
-        conflicts_count=conflicts_count,
-        table_rows="\n".join(rows),
-        generated_date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    # Render all rows first, then assemble the document with a single join
+    rows = [
+        _render_html_row(anime, resolution_map.get(anime.anidb_id))
+        for anime in sorted(anime_list, key=lambda a: a.display_title.lower())
+    ]
+    html_content = "".join(
+        (
+            _HTML_HEAD.format(
+                total_count=total_count,
+                mapped_count=mapped_count,
+                unmapped_count=unmapped_count,
+                with_ratings=with_ratings,
+                conflicts_count=conflicts_count,
+            ),
+            "\n".join(rows),
+            _HTML_TAIL.format(generated_date=datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+        )
     )
 
     if output_path:
@@ -491,55 +507,63 @@ def generate_html_report(
     return html_content
 
 
-def generate_csv_report(
+CSV_FIELDS = (
+    "Title",
+    "Title (Romaji)",
+    "Type",
+    "AniDB ID",
+    "AniDB Rating",
+    "AniDB Rated At",
+    "Trakt Rating",
+    "Trakt Rated At",
+    "Conflict",
+    "Watched Episodes",
+    "Total Episodes",
+    "TVDB ID",
+    "IMDB ID",
+    "TMDB ID",
+    "Status",
+    "AniDB URL",
+    "TVDB URL",
+    "Trakt Search URL",
+)
+
+
+def _iter_csv_rows(
     anime_list: list[AnimeEntry],
-    resolutions: list[ConflictResolution] | None = None,
-    output_path: Path | None = None,
-) -> list[dict]:
-    """Generate CSV report.
-
-    Args:
-        anime_list: List of AnimeEntry objects.
-        resolutions: Optional conflict resolutions.
-        output_path: Path to write CSV file.
-
-    Returns:
-        List of row dictionaries.
-    """
+    resolutions: list[ConflictResolution] | None,
+) -> Iterator[dict]:
+    """Yield CSV report rows sorted by display title."""
     # Build resolution lookup
     resolution_map = {}
     if resolutions:
         for r in resolutions:
             resolution_map[r.anime.anidb_id] = r
 
-    rows = []
     for anime in sorted(anime_list, key=lambda a: a.display_title.lower()):
         resolution = resolution_map.get(anime.anidb_id)
         links = _generate_links(anime)
         status = _get_status_indicator(anime, resolution)
 
-        row = {
-            "Title": anime.display_title,
-            "Title (Romaji)": anime.title,
-            "Type": anime.anime_type.name,
-            "AniDB ID": anime.anidb_id,
-            "AniDB Rating": anime.rating.score if anime.rating else "",
-            "AniDB Rated At": _format_date(anime.rating.rated_at) if anime.rating else "",
-            "Trakt Rating": "",
-            "Trakt Rated At": "",
-            "Conflict": "",
-            "Watched Episodes": anime.watched_count,
-            "Total Episodes": anime.total_episodes,
-            "TVDB ID": anime.mapped_ids.tvdb_id if anime.mapped_ids else "",
-            "IMDB ID": anime.mapped_ids.imdb_id if anime.mapped_ids else "",
-            "TMDB ID": "",
-            "Status": status,
-            "AniDB URL": links.get("anidb", ""),
-            "TVDB URL": links.get("tvdb", ""),
-            "Trakt Search URL": links.get("trakt", ""),
-        }
+        # Start from CSV_FIELDS so the columns are defined in one place
+        row = dict.fromkeys(CSV_FIELDS, "")
+        row["Title"] = anime.display_title
+        row["Title (Romaji)"] = anime.title
+        row["Type"] = anime.anime_type.name
+        row["AniDB ID"] = anime.anidb_id
+        if anime.rating:
+            row["AniDB Rating"] = anime.rating.score
+            row["AniDB Rated At"] = _format_date(anime.rating.rated_at)
+        row["Watched Episodes"] = anime.watched_count
+        row["Total Episodes"] = anime.total_episodes
+        row["Status"] = status
+        row["AniDB URL"] = links.get("anidb", "")
+        row["TVDB URL"] = links.get("tvdb", "")
+        row["Trakt Search URL"] = links.get("trakt", "")
 
         if anime.mapped_ids:
+            row["TVDB ID"] = anime.mapped_ids.tvdb_id
+            row["IMDB ID"] = anime.mapped_ids.imdb_id
             if anime.mapped_ids.tmdb_movie_id:
                 row["TMDB ID"] = anime.mapped_ids.tmdb_movie_id
             elif anime.mapped_ids.tmdb_show_id:
@@ -552,16 +576,37 @@ def generate_csv_report(
             if resolution.has_rating_conflict:
                 row["Conflict"] = "Keep AniDB" if resolution.keep_anidb_rating else "Keep Trakt"
 
-        rows.append(row)
+        yield row
+
+
+def generate_csv_report(
+    anime_list: list[AnimeEntry],
+    resolutions: list[ConflictResolution] | None = None,
+    output_path: Path | None = None,
+) -> list[dict]:
+    """Generate CSV report.
+
+    Args:
+        anime_list: List of AnimeEntry objects.
+        resolutions: Optional conflict resolutions.
+        output_path: Path to write CSV file.
+
+    Returns:
+        List of row dictionaries.
+    """
+    rows = []
 
     if output_path:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         with open(output_path, "w", newline="", encoding="utf-8") as f:
-            if rows:
-                writer = csv.DictWriter(f, fieldnames=rows[0].keys())
-                writer.writeheader()
-                writer.writerows(rows)
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            for row in _iter_csv_rows(anime_list, resolutions):
+                writer.writerow(row)
+                rows.append(row)
         logger.info(f"Wrote CSV report to {output_path}")
+    else:
+        rows.extend(_iter_csv_rows(anime_list, resolutions))
 
     return rows
 
@@ -579,8 +624,6 @@ def generate_unmapped_json(
     Returns:
         List of unmapped anime data.
     """
-    import json
-
     data = []
     for anime in sorted(unmapped, key=lambda a: a.display_title.lower()):
         data.append(
@@ -598,8 +641,8 @@ def generate_unmapped_json(
 
     if output_path:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Encode in one go: json.dump issues a file write per encoder chunk
+        output_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
         logger.info(f"Wrote unmapped anime to {output_path}")
 
     return data
@@ -1,7 +1,7 @@
 """Trakt data fetching and conflict resolution."""
 
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 
 from .id_mapper import IDMapper
 from .models import AnimeEntry, ConflictResolution, TraktEntry
@@ -11,14 +11,19 @@
 
 
 def iso_to_datetime(iso_str: str | None) -> datetime | None:
-    """Parse ISO 8601 datetime string."""
+    """Parse ISO 8601 datetime string into a naive UTC datetime."""
     if not iso_str:
         return None
+    # Trakt timestamps end in "Z", which fromisoformat only accepts from Python 3.11
+    if iso_str.endswith("Z"):
+        iso_str = iso_str[:-1]
     try:
-        iso_str = iso_str.replace("Z", "+00:00")
-        return datetime.fromisoformat(iso_str.replace("+00:00", ""))
+        dt = datetime.fromisoformat(iso_str)
     except ValueError:
         return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
 
 
 class TraktDataFetcher:
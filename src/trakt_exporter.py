@@ -2,8 +2,13 @@
 
 import json
 import logging
+import os
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from itertools import chain
 from pathlib import Path
+from typing import IO
 
 from .id_mapper import IDMapper
 from .models import AnimeEntry, ConflictResolution
@@ -28,6 +33,24 @@
 ]
 
 
+@contextmanager
+def _atomic_open(path: Path, mode: str = "w") -> Iterator[IO]:
+    """Open a temporary sibling of path for writing and move it over path on success.
+
+    If the body raises (including KeyboardInterrupt), the temporary file is removed
+    and path is left untouched.
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    encoding = None if "b" in mode else "utf-8"
+    try:
+        with open(tmp_path, mode, encoding=encoding) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 class TraktExporter:
     """Export AniDB data to Trakt format and manage syncing."""
 
@@ -60,20 +83,18 @@ def resolve_conflicts(
 
     def generate_history_json(self, anime_list: list[AnimeEntry]) -> dict:
         """Generate Trakt history JSON format."""
+        if not anime_list:
+            return {}
+
         shows = []
         movies = []
+        buckets = {"shows": shows, "movies": movies}
 
         for anime in anime_list:
-            if not anime.is_mapped or not anime.watched_episodes:
-                continue
-
-            ids = anime.mapped_ids
-            trakt_ids = ids.get_trakt_ids()
-
-            if ids.is_movie:
-                movies.append(self._build_movie_history(anime, trakt_ids))
-            else:
-                shows.append(self._build_show_history(anime, ids, trakt_ids))
+            item = self._history_entry(anime)
+            if item:
+                kind, entry = item
+                buckets[kind].append(entry)
 
         result = {}
         if shows:
@@ -82,6 +103,19 @@ def generate_history_json(self, anime_list: list[AnimeEntry]) -> dict:
             result["movies"] = movies
         return result
 
+    def _history_entry(self, anime: AnimeEntry) -> tuple[str, dict] | None:
+        """Build a ("shows" | "movies", entry) history item, or None if nothing to sync."""
+        # Check the plain attribute before the is_mapped property chain
+        if not anime.watched_episodes or not anime.is_mapped:
+            return None
+
+        ids = anime.mapped_ids
+        trakt_ids = ids.get_trakt_ids()
+
+        if ids.is_movie:
+            return "movies", self._build_movie_history(anime, trakt_ids)
+        return "shows", self._build_show_history(anime, ids, trakt_ids)
+
     def _build_movie_history(self, anime: AnimeEntry, trakt_ids: dict) -> dict:
         """Build movie history entry."""
         dates = [ep.watched_at for ep in anime.watched_episodes if ep.watched_at]
@@ -95,20 +129,25 @@ def _build_movie_history(self, anime: AnimeEntry, trakt_ids: dict) -> dict:
     def _build_show_history(self, anime: AnimeEntry, ids, trakt_ids: dict) -> dict:
         """Build show history entry with seasons/episodes."""
         seasons_data: dict[int, list] = defaultdict(list)
+        map_episode = self.id_mapper.map_episode_to_trakt
+        to_iso = datetime_to_iso
 
         for ep in anime.watched_episodes:
-            trakt_season, trakt_ep = self.id_mapper.map_episode_to_trakt(ep, ids)
-            ep_entry = {"number": trakt_ep}
-            if ep.watched_at:
-                ep_entry["watched_at"] = datetime_to_iso(ep.watched_at)
+            trakt_season, trakt_ep = map_episode(ep, ids)
+            watched_at = ep.watched_at
+            if watched_at:
+                ep_entry = {"number": trakt_ep, "watched_at": to_iso(watched_at)}
+            else:
+                ep_entry = {"number": trakt_ep}
             seasons_data[trakt_season].append(ep_entry)
 
-        return {
-            "ids": trakt_ids,
-            "seasons": [
-                {"number": num, "episodes": eps} for num, eps in sorted(seasons_data.items())
-            ],
-        }
+        # Most shows map to a single season, which needs no sorting
+        items = seasons_data.items()
+        if len(seasons_data) > 1:
+            items = sorted(items)
+        seasons = [{"number": num, "episodes": eps} for num, eps in items]
+
+        return {"ids": trakt_ids, "seasons": seasons}
 
     def generate_ratings_json(
         self,
@@ -116,33 +155,20 @@ def generate_ratings_json(
         resolutions: list[ConflictResolution] | None = None,
     ) -> dict:
         """Generate Trakt ratings JSON format."""
+        if not anime_list:
+            return {}
+
         shows = []
         movies = []
+        buckets = {"shows": shows, "movies": movies}
 
         resolution_map = {r.anime.anidb_id: r for r in (resolutions or [])}
 
         for anime in anime_list:
-            if not anime.is_mapped or not anime.rating:
-                continue
-
-            # Skip if conflict resolution says keep Trakt rating
-            if anime.anidb_id in resolution_map:
-                res = resolution_map[anime.anidb_id]
-                if not res.keep_anidb_rating and res.rating_conflict:
-                    continue
-
-            ids = anime.mapped_ids
-            entry = {
-                "ids": ids.get_trakt_ids(),
-                "rating": anime.rating.score,
-            }
-            if anime.rating.rated_at:
-                entry["rated_at"] = datetime_to_iso(anime.rating.rated_at)
-
-            if ids.is_movie:
-                movies.append(entry)
-            else:
-                shows.append(entry)
+            item = self._rating_entry(anime, resolution_map)
+            if item:
+                kind, entry = item
+                buckets[kind].append(entry)
 
         result = {}
         if shows:
@@ -151,6 +177,30 @@ def generate_ratings_json(
             result["movies"] = movies
         return result
 
+    def _rating_entry(
+        self,
+        anime: AnimeEntry,
+        resolution_map: dict[int, ConflictResolution],
+    ) -> tuple[str, dict] | None:
+        """Build a ("shows" | "movies", entry) rating item, or None if nothing to sync."""
+        if not anime.rating or not anime.is_mapped:
+            return None
+
+        # Skip if conflict resolution says keep Trakt rating
+        res = resolution_map.get(anime.anidb_id)
+        if res and not res.keep_anidb_rating and res.rating_conflict:
+            return None
+
+        ids = anime.mapped_ids
+        entry = {
+            "ids": ids.get_trakt_ids(),
+            "rating": anime.rating.score,
+        }
+        if anime.rating.rated_at:
+            entry["rated_at"] = datetime_to_iso(anime.rating.rated_at)
+
+        return ("movies" if ids.is_movie else "shows"), entry
+
     def export_to_files(
         self,
         anime_list: list[AnimeEntry],
@@ -159,27 +209,156 @@ def export_to_files(
     ) -> dict[str, Path]:
         """Export data to JSON files."""
         output_dir.mkdir(parents=True, exist_ok=True)
+        history_path = output_dir / "trakt_history.json"
+        ratings_path = output_dir / "trakt_ratings.json"
         files = {}
 
         history_data = self.generate_history_json(anime_list)
         if history_data:
-            path = output_dir / "trakt_history.json"
-            self._write_json(history_data, path)
-            files["history"] = path
+            self._write_json(history_data, history_path)
+            files["history"] = history_path
 
         ratings_data = self.generate_ratings_json(anime_list, resolutions)
         if ratings_data:
-            path = output_dir / "trakt_ratings.json"
-            self._write_json(ratings_data, path)
-            files["ratings"] = path
+            self._write_json(ratings_data, ratings_path)
+            files["ratings"] = ratings_path
 
         return files
 
     def _write_json(self, data: dict, path: Path) -> None:
-        """Write JSON to file."""
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        """Write JSON to file atomically, skipping the write if content is unchanged."""
+        content = json.dumps(data, indent=2).encode("utf-8")
+
+        try:
+            if path.read_bytes() == content:
+                logger.info(f"{path.name} unchanged, skipping write")
+                return
+        except FileNotFoundError:
+            pass
+
+        with _atomic_open(path, "wb") as f:
+            f.write(content)
+        logger.info(f"Wrote {path.name} to {path}")
+
+    def export_to_files_streaming(
+        self,
+        anime_list: list[AnimeEntry],
+        output_dir: Path,
+        resolutions: list[ConflictResolution] | None = None,
+    ) -> dict[str, Path]:
+        """Export data to compact JSON files, writing entries as they are built.
+
+        Produces the same structure as export_to_files without materializing the
+        full history/ratings dicts first, keeping peak memory low on large libraries.
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        files = {}
+
+        path = output_dir / "trakt_history.json"
+        if self._stream_json((self._history_entry(a) for a in anime_list), path):
+            files["history"] = path
+
+        resolution_map = {r.anime.anidb_id: r for r in (resolutions or [])}
+        path = output_dir / "trakt_ratings.json"
+        ratings = (self._rating_entry(a, resolution_map) for a in anime_list)
+        if self._stream_json(ratings, path):
+            files["ratings"] = path
+
+        return files
+
+    def _stream_json(self, items: Iterable[tuple[str, dict] | None], path: Path) -> bool:
+        """Stream ("shows" | "movies", entry) items to path as a shows/movies JSON object.
+
+        Shows are written as they arrive; movies (few, and small) are buffered as
+        encoded strings so they can follow in their own array.
+
+        Returns:
+            True if anything was written, False if there was nothing to export.
+        """
+        # Nothing is created on disk unless there is at least one entry
+        items = (item for item in items if item is not None)
+        first = next(items, None)
+        if first is None:
+            return False
+
+        movies: list[str] = []
+        has_shows = False
+        separators = (",", ":")
+
+        with _atomic_open(path) as f:
+            for kind, entry in chain((first,), items):
+                if kind == "movies":
+                    movies.append(json.dumps(entry, separators=separators))
+                    continue
+                f.write("," if has_shows else '{"shows":[')
+                f.write(json.dumps(entry, separators=separators))
+                has_shows = True
+
+            if has_shows:
+                f.write("]")
+            if movies:
+                f.write("," if has_shows else "{")
+                f.write('"movies":[')
+                f.write(",".join(movies))
+                f.write("]")
+            f.write("}")
+
+        logger.info(f"Wrote {path.name} to {path}")
+        return True
+
+    def export_to_jsonl(
+        self,
+        anime_list: list[AnimeEntry],
+        output_dir: Path,
+        resolutions: list[ConflictResolution] | None = None,
+    ) -> dict[str, Path]:
+        """Export data as JSON Lines, one single-item Trakt payload per line.
+
+        Each line is a {"shows": [entry]} or {"movies": [entry]} object that can be
+        sent to the sync endpoints on its own, so consumers can upload line by line.
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        files = {}
+
+        path = output_dir / "trakt_history.jsonl"
+        history = (self._history_entry(a) for a in anime_list)
+        if self._write_jsonl(self._iter_payloads(history), path):
+            files["history"] = path
+
+        resolution_map = {r.anime.anidb_id: r for r in (resolutions or [])}
+        path = output_dir / "trakt_ratings.jsonl"
+        ratings = (self._rating_entry(a, resolution_map) for a in anime_list)
+        if self._write_jsonl(self._iter_payloads(ratings), path):
+            files["ratings"] = path
+
+        return files
+
+    @staticmethod
+    def _iter_payloads(items: Iterable[tuple[str, dict] | None]) -> Iterator[dict]:
+        """Wrap each ("shows" | "movies", entry) item as a single-item Trakt payload."""
+        for item in items:
+            if item is not None:
+                kind, entry = item
+                yield {kind: [entry]}
+
+    def _write_jsonl(self, payloads: Iterable[dict], path: Path) -> bool:
+        """Write payloads to path one per line, atomically.
+
+        Returns:
+            True if anything was written, False if there was nothing to export.
+        """
+        payloads = iter(payloads)
+        first = next(payloads, None)
+        if first is None:
+            return False
+
+        with _atomic_open(path) as f:
+            for payload in chain((first,), payloads):
+                f.write(json.dumps(payload))
+                f.write("\n")
+
         logger.info(f"Wrote {path.name} to {path}")
+        return True
 
     def sync_to_trakt(
         self,
@@ -1,6 +1,7 @@
 """Tests for AniDB XML parser."""
 
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 
 import pytest
@@ -19,6 +20,52 @@
 SAMPLE_SINGLEFILE = FIXTURES_DIR / "sample_singlefile.xml"
 
 
+@pytest.fixture(scope="session")
+def sample_export_parser():
+    """Parse the plain-new sample export once per test session."""
+    parser = AniDBParser(SAMPLE_EXPORT)
+    parser.parse()
+    return parser
+
+
+@pytest.fixture(scope="session")
+def sample_export_anime(sample_export_parser):
+    """Parsed entries from the plain-new sample export."""
+    return sample_export_parser.parse()
+
+
+@pytest.fixture(scope="session")
+def sample_export_by_id(sample_export_anime):
+    """Plain-new sample entries indexed by AniDB ID."""
+    return {a.anidb_id: a for a in sample_export_anime}
+
+
+@pytest.fixture(scope="session")
+def sample_singlefile_parser():
+    """Parse the singlefile sample export once per test session."""
+    parser = AniDBParser(SAMPLE_SINGLEFILE)
+    parser.parse()
+    return parser
+
+
+@pytest.fixture(scope="session")
+def sample_singlefile_anime(sample_singlefile_parser):
+    """Parsed entries from the singlefile sample export."""
+    return sample_singlefile_parser.parse()
+
+
+@pytest.fixture(scope="session")
+def sample_singlefile_by_id(sample_singlefile_anime):
+    """Singlefile sample entries indexed by AniDB ID."""
+    return {a.anidb_id: a for a in sample_singlefile_anime}
+
+
+def _assert_fields(anime, expected: dict) -> None:
+    """Assert (dotted) attribute values on a parsed entry."""
+    for path, value in expected.items():
+        assert attrgetter(path)(anime) == value, path
+
+
 class TestParseAnidbDate:
     """Tests for parse_anidb_date function."""
 
@@ -37,6 +84,15 @@ def test_iso_format(self):
         result = parse_anidb_date("2023-04-15")
         assert result == datetime(2023, 4, 15)
 
+    def test_single_digit_day_month(self):
+        """Single-digit day and month are accepted."""
+        assert parse_anidb_date("1.3.2023 9:05") == datetime(2023, 3, 1, 9, 5)
+
+    def test_out_of_range_date(self):
+        """Out-of-range date components return None."""
+        assert parse_anidb_date("31.02.2023") is None
+        assert parse_anidb_date("15.04.2023 25:00") is None
+
     def test_empty_string(self):
         """Empty string returns None."""
         assert parse_anidb_date("") is None
@@ -116,6 +172,12 @@ def test_invalid_prefix_number(self):
         with pytest.raises(ValueError):
             parse_episode_number("Sabc")
 
+    @pytest.mark.parametrize("ep_str", ["١٢", "S١", "２"])
+    def test_non_ascii_digits_rejected(self, ep_str):
+        """Only ASCII digits are accepted as episode numbers."""
+        with pytest.raises(ValueError):
+            parse_episode_number(ep_str)
+
 
 class TestGetAnimeType:
     """Tests for get_anime_type function."""
@@ -144,6 +206,16 @@ def test_unknown_type(self):
         """Unknown type code returns UNKNOWN."""
         assert get_anime_type("99") == AnimeType.UNKNOWN
 
+    @pytest.mark.parametrize("code", ["02", " 2 ", "+2"])
+    def test_non_canonical_code(self, code):
+        """Padded or signed codes parse like their integer value."""
+        assert get_anime_type(code) == AnimeType.TV
+
+    @pytest.mark.parametrize("code", [None, "", "abc"])
+    def test_missing_or_invalid_code(self, code):
+        """Missing or non-numeric codes return UNKNOWN."""
+        assert get_anime_type(code) == AnimeType.UNKNOWN
+
     def test_none_input(self):
         """None input returns UNKNOWN."""
         assert get_anime_type(None) == AnimeType.UNKNOWN
@@ -161,115 +233,110 @@ def test_file_not_found(self):
         with pytest.raises(AniDBParseError, match="File not found"):
             AniDBParser("/nonexistent/path.xml")
 
-    def test_parse_sample_export(self):
-        """Parse sample export file."""
-        parser = AniDBParser(SAMPLE_EXPORT)
-        anime_list = parser.parse()
-
-        # Should have 7 entries in the sample
-        assert len(anime_list) == 7
-
-    def test_parse_attack_on_titan(self):
-        """Parse Attack on Titan entry correctly."""
-        parser = AniDBParser(SAMPLE_EXPORT)
-        anime_list = parser.parse()
-
-        # Find Attack on Titan
-        aot = next(a for a in anime_list if a.anidb_id == 11061)
-
-        assert aot.title == "Shingeki no Kyojin"
-        assert aot.title_english == "Attack on Titan"
-        assert aot.display_title == "Attack on Titan"
-        assert aot.anime_type == AnimeType.TV
-        assert aot.total_episodes == 25
-        assert aot.total_specials == 5
-        assert not aot.is_hentai
-
-        # Rating
-        assert aot.rating is not None
-        assert aot.rating.score == 9
-        assert aot.rating.rated_at == datetime(2023, 4, 15, 20, 30)
-        assert not aot.rating.is_temporary
-
-        # Watched episodes (2 regular + 1 special)
-        assert len(aot.watched_episodes) == 3
-        assert aot.watched_count == 2  # Regular episodes
-        assert aot.watched_special_count == 1  # Special episodes
-
-    def test_parse_movie(self):
-        """Parse movie entry correctly."""
-        parser = AniDBParser(SAMPLE_EXPORT)
-        anime_list = parser.parse()
-
-        movie = next(a for a in anime_list if a.anidb_id == 10083)
-
-        assert movie.title == "Kimi no Na wa."
-        assert movie.title_english == "Your Name."
-        assert movie.anime_type == AnimeType.MOVIE
-        assert movie.is_movie
-        assert movie.rating.score == 10
+    def test_directory_path(self, tmp_path):
+        """Raise error when the path is a directory, not a file."""
+        with pytest.raises(AniDBParseError, match="File not found"):
+            AniDBParser(tmp_path)
 
-    def test_parse_temp_vote(self):
-        """Parse temporary vote correctly."""
-        parser = AniDBParser(SAMPLE_EXPORT)
-        anime_list = parser.parse()
+    def test_malformed_xml(self, tmp_path):
+        """Raise error for malformed XML."""
+        path = tmp_path / "broken.xml"
+        path.write_text("<MyList><Anime><AnimeID>1</AnimeID>")
 
-        death_note = next(a for a in anime_list if a.anidb_id == 4563)
+        with pytest.raises(AniDBParseError, match="Failed to parse XML"):
+            AniDBParser(path).parse()
 
-        assert death_note.rating is not None
-        assert death_note.rating.score == 8
-        assert death_note.rating.is_temporary
+    def test_format_detected_from_anime_tag(self, tmp_path):
+        """Detect singlefile format from lowercase anime elements under an unknown root."""
+        path = tmp_path / "export.xml"
+        path.write_text("<export><anime><AnimeID>1</AnimeID><Name>Test</Name></anime></export>")
 
-    def test_parse_restricted_content(self):
-        """Parse restricted content flag."""
-        parser = AniDBParser(SAMPLE_EXPORT)
+        parser = AniDBParser(path)
         anime_list = parser.parse()
 
-        restricted = next(a for a in anime_list if a.anidb_id == 99999)
-        assert restricted.is_hentai
+        assert parser._format == "singlefile"
+        assert [a.anidb_id for a in anime_list] == [1]
 
-    def test_get_watched_anime(self):
+    def test_parse_sample_export(self, sample_export_anime):
+        """Parse sample export file."""
+        # Should have 7 entries in the sample
+        assert len(sample_export_anime) == 7
+
+    @pytest.mark.parametrize(
+        ("anidb_id", "expected"),
+        [
+            (
+                11061,
+                {
+                    "title": "Shingeki no Kyojin",
+                    "title_english": "Attack on Titan",
+                    "display_title": "Attack on Titan",
+                    "anime_type": AnimeType.TV,
+                    "total_episodes": 25,
+                    "total_specials": 5,
+                    "is_hentai": False,
+                    "rating.score": 9,
+                    "rating.rated_at": datetime(2023, 4, 15, 20, 30),
+                    "rating.is_temporary": False,
+                    # 2 regular + 1 special
+                    "watched_count": 2,
+                    "watched_special_count": 1,
+                },
+            ),
+            (
+                10083,
+                {
+                    "title": "Kimi no Na wa.",
+                    "title_english": "Your Name.",
+                    "anime_type": AnimeType.MOVIE,
+                    "is_movie": True,
+                    "rating.score": 10,
+                },
+            ),
+            (4563, {"rating.score": 8, "rating.is_temporary": True}),
+            (99999, {"is_hentai": True}),
+        ],
+        ids=["attack-on-titan", "movie", "temp-vote", "restricted"],
+    )
+    def test_anime_fields(self, sample_export_by_id, anidb_id, expected):
+        """Parse anime fields correctly."""
+        _assert_fields(sample_export_by_id[anidb_id], expected)
+
+    def test_get_watched_anime(self, sample_export_parser):
         """Get only anime with watched episodes or ratings."""
-        parser = AniDBParser(SAMPLE_EXPORT)
-        watched = parser.get_watched_anime()
+        watched = sample_export_parser.get_watched_anime()
 
         # Should exclude "Plan to Watch" (no watched eps, no rating)
         assert len(watched) == 6
         assert all(a.watched_episodes or a.rating for a in watched)
 
-    def test_get_watched_anime_exclude_hentai(self):
+    def test_get_watched_anime_exclude_hentai(self, sample_export_parser):
         """Exclude hentai from watched list."""
-        parser = AniDBParser(SAMPLE_EXPORT)
-        watched = parser.get_watched_anime(exclude_hentai=True)
+        watched = sample_export_parser.get_watched_anime(exclude_hentai=True)
 
         assert len(watched) == 5
         assert not any(a.is_hentai for a in watched)
 
-    def test_multi_file_episode_earliest_date(self):
+    def test_multi_file_episode_earliest_date(self, sample_export_by_id):
         """Use earliest ViewDate for multi-file episodes."""
-        parser = AniDBParser(SAMPLE_EXPORT)
-        anime_list = parser.parse()
-
-        multi_file = next(a for a in anime_list if a.anidb_id == 77777)
+        multi_file = sample_export_by_id[77777]
 
         # Should have 1 episode with the earlier date (05.06.2023)
         assert len(multi_file.watched_episodes) == 1
         assert multi_file.watched_episodes[0].watched_at == datetime(2023, 6, 5, 18, 0)
 
-    def test_get_stats(self):
+    def test_get_stats(self, sample_export_parser):
         """Get export statistics."""
-        parser = AniDBParser(SAMPLE_EXPORT)
-        stats = parser.get_stats()
+        stats = sample_export_parser.get_stats()
 
         assert stats["total_anime"] == 7
         assert stats["with_ratings"] == 5
         assert stats["with_watched_episodes"] == 6
         assert stats["hentai_count"] == 1
 
-    def test_iter_anime(self):
+    def test_iter_anime(self, sample_export_parser):
         """Iterate over anime entries."""
-        parser = AniDBParser(SAMPLE_EXPORT)
-        anime_ids = [a.anidb_id for a in parser.iter_anime()]
+        anime_ids = [a.anidb_id for a in sample_export_parser.iter_anime()]
 
         assert len(anime_ids) == 7
         assert 11061 in anime_ids  # Attack on Titan
@@ -279,22 +346,16 @@ def test_iter_anime(self):
 class TestWatchedEpisode:
     """Tests for WatchedEpisode model."""
 
-    def test_display_number_regular(self):
+    def test_display_number_regular(self, sample_export_by_id):
         """Regular episode display number."""
-        parser = AniDBParser(SAMPLE_EXPORT)
-        anime_list = parser.parse()
-
-        aot = next(a for a in anime_list if a.anidb_id == 11061)
+        aot = sample_export_by_id[11061]
         regular_ep = next(ep for ep in aot.watched_episodes if not ep.is_special)
 
         assert regular_ep.display_number == "1" or regular_ep.display_number == "2"
 
-    def test_display_number_special(self):
+    def test_display_number_special(self, sample_export_by_id):
         """Special episode display number with prefix."""
-        parser = AniDBParser(SAMPLE_EXPORT)
-        anime_list = parser.parse()
-
-        aot = next(a for a in anime_list if a.anidb_id == 11061)
+        aot = sample_export_by_id[11061]
         special_ep = next(ep for ep in aot.watched_episodes if ep.is_special)
 
         assert special_ep.display_number == "S1"
@@ -303,104 +364,61 @@ def test_display_number_special(self):
 class TestSinglefileFormat:
     """Tests for xml-singlefile-dataonly format parsing."""
 
-    def test_parse_singlefile_format(self):
+    def test_parse_singlefile_format(self, sample_singlefile_anime):
         """Parse singlefile format correctly."""
-        parser = AniDBParser(SAMPLE_SINGLEFILE)
-        anime_list = parser.parse()
-
         # Should have 4 anime entries
-        assert len(anime_list) == 4
+        assert len(sample_singlefile_anime) == 4
 
-    def test_singlefile_format_detection(self):
+    def test_singlefile_format_detection(self, sample_singlefile_parser):
         """Detect singlefile format from root element."""
-        parser = AniDBParser(SAMPLE_SINGLEFILE)
-        parser.parse()
-        assert parser._format == "singlefile"
-
-    def test_singlefile_anime_parsing(self):
-        """Parse anime metadata from singlefile format."""
-        parser = AniDBParser(SAMPLE_SINGLEFILE)
-        anime_list = parser.parse()
-
-        aot = next(a for a in anime_list if a.anidb_id == 11061)
-
-        assert aot.title == "Shingeki no Kyojin"
-        assert aot.title_english == "Attack on Titan"
-        assert aot.anime_type == AnimeType.TV
-        assert aot.total_episodes == 25
-        assert aot.total_specials == 5
-        assert not aot.is_hentai
-
-    def test_singlefile_rating_parsing(self):
-        """Parse ratings from singlefile format."""
-        parser = AniDBParser(SAMPLE_SINGLEFILE)
-        anime_list = parser.parse()
-
-        aot = next(a for a in anime_list if a.anidb_id == 11061)
-
-        assert aot.rating is not None
-        assert aot.rating.score == 9
-        assert aot.rating.rated_at == datetime(2023, 4, 15, 20, 30)
-
-    def test_singlefile_temp_vote(self):
-        """Parse temporary vote from singlefile format."""
-        parser = AniDBParser(SAMPLE_SINGLEFILE)
-        anime_list = parser.parse()
-
-        death_note = next(a for a in anime_list if a.anidb_id == 4563)
-
-        assert death_note.rating is not None
-        assert death_note.rating.score == 8
-        assert death_note.rating.is_temporary
-
-    def test_singlefile_watched_episodes(self):
+        assert sample_singlefile_parser._format == "singlefile"
+
+    @pytest.mark.parametrize(
+        ("anidb_id", "expected"),
+        [
+            (
+                11061,
+                {
+                    "title": "Shingeki no Kyojin",
+                    "title_english": "Attack on Titan",
+                    "anime_type": AnimeType.TV,
+                    "total_episodes": 25,
+                    "total_specials": 5,
+                    "is_hentai": False,
+                    "rating.score": 9,
+                    "rating.rated_at": datetime(2023, 4, 15, 20, 30),
+                },
+            ),
+            (4563, {"rating.score": 8, "rating.is_temporary": True}),
+            (10083, {"anime_type": AnimeType.MOVIE, "is_movie": True, "rating.score": 10}),
+            (99999, {"is_hentai": True}),
+        ],
+        ids=["attack-on-titan", "temp-vote", "movie", "hentai"],
+    )
+    def test_singlefile_anime_fields(self, sample_singlefile_by_id, anidb_id, expected):
+        """Parse anime metadata and ratings from singlefile format."""
+        _assert_fields(sample_singlefile_by_id[anidb_id], expected)
+
+    def test_singlefile_watched_episodes(self, sample_singlefile_by_id):
         """Parse watched episodes joined from file elements."""
-        parser = AniDBParser(SAMPLE_SINGLEFILE)
-        anime_list = parser.parse()
-
-        aot = next(a for a in anime_list if a.anidb_id == 11061)
+        aot = sample_singlefile_by_id[11061]
 
         # Should have 3 watched episodes (2 regular + 1 special)
         assert len(aot.watched_episodes) == 3
         assert aot.watched_count == 2
         assert aot.watched_special_count == 1
 
-    def test_singlefile_special_episodes(self):
+    def test_singlefile_special_episodes(self, sample_singlefile_by_id):
         """Parse special episodes from singlefile format."""
-        parser = AniDBParser(SAMPLE_SINGLEFILE)
-        anime_list = parser.parse()
-
-        aot = next(a for a in anime_list if a.anidb_id == 11061)
+        aot = sample_singlefile_by_id[11061]
 
         special_ep = next(ep for ep in aot.watched_episodes if ep.is_special)
         assert special_ep.episode_number == 1
         assert special_ep.display_number == "S1"
 
-    def test_singlefile_movie_type(self):
-        """Parse movie from singlefile format."""
-        parser = AniDBParser(SAMPLE_SINGLEFILE)
-        anime_list = parser.parse()
-
-        movie = next(a for a in anime_list if a.anidb_id == 10083)
-
-        assert movie.anime_type == AnimeType.MOVIE
-        assert movie.is_movie
-        assert movie.rating.score == 10
-
-    def test_singlefile_hentai_flag(self):
-        """Parse hentai flag from singlefile format."""
-        parser = AniDBParser(SAMPLE_SINGLEFILE)
-        anime_list = parser.parse()
-
-        restricted = next(a for a in anime_list if a.anidb_id == 99999)
-        assert restricted.is_hentai
-
-    def test_singlefile_multi_file_earliest_date(self):
+    def test_singlefile_multi_file_earliest_date(self, sample_singlefile_by_id):
         """Use earliest ViewDate when multiple files for same episode."""
-        parser = AniDBParser(SAMPLE_SINGLEFILE)
-        anime_list = parser.parse()
-
-        death_note = next(a for a in anime_list if a.anidb_id == 4563)
+        death_note = sample_singlefile_by_id[4563]
 
         # Episode 1 has two files: 01.03.2023 and 15.02.2023
         # Should use the earlier date (15.02.2023)
@@ -409,20 +427,16 @@ def test_singlefile_multi_file_earliest_date(self):
         )
         assert ep1.watched_at == datetime(2023, 2, 15)
 
-    def test_singlefile_unwatched_files_ignored(self):
+    def test_singlefile_unwatched_files_ignored(self, sample_singlefile_by_id):
         """Ignore files with MyWatched=0."""
-        parser = AniDBParser(SAMPLE_SINGLEFILE)
-        anime_list = parser.parse()
-
-        aot = next(a for a in anime_list if a.anidb_id == 11061)
+        aot = sample_singlefile_by_id[11061]
 
         # Should still only have 3 episodes, unwatched file ignored
         assert len(aot.watched_episodes) == 3
 
-    def test_singlefile_stats(self):
+    def test_singlefile_stats(self, sample_singlefile_parser):
         """Get stats from singlefile format."""
-        parser = AniDBParser(SAMPLE_SINGLEFILE)
-        stats = parser.get_stats()
+        stats = sample_singlefile_parser.get_stats()
 
         assert stats["total_anime"] == 4
         assert stats["with_ratings"] == 4
@@ -1,7 +1,6 @@
 """Tests for platform-specific path utilities."""
 
-import os
-from unittest.mock import patch
+import pytest
 
 from src.paths import APP_NAME, get_config_dir, get_token_path
 
@@ -9,41 +8,35 @@
 class TestGetConfigDir:
     """Tests for get_config_dir function."""
 
-    def test_windows_uses_appdata_env_var(self):
-        """Windows reads APPDATA environment variable."""
-        with (
-            patch("src.paths.sys.platform", "win32"),
-            patch.dict(os.environ, {"APPDATA": "/fake/appdata"}, clear=True),
-        ):
-            result = get_config_dir()
-            assert result.parts[-2:] == ("appdata", APP_NAME)
-
-    def test_windows_fallback_uses_home_appdata_roaming(self):
-        """Windows falls back to ~/AppData/Roaming when APPDATA not set."""
-        with patch("src.paths.sys.platform", "win32"), patch.dict(os.environ, {}, clear=True):
-            result = get_config_dir()
-            assert result.parts[-3:] == ("AppData", "Roaming", APP_NAME)
-
-    def test_macos_uses_library_application_support(self):
-        """macOS uses ~/Library/Application Support."""
-        with patch("src.paths.sys.platform", "darwin"):
-            result = get_config_dir()
-            assert result.parts[-3:] == ("Library", "Application Support", APP_NAME)
-
-    def test_linux_uses_xdg_config_home_when_set(self):
-        """Linux reads XDG_CONFIG_HOME environment variable."""
-        with (
-            patch("src.paths.sys.platform", "linux"),
-            patch.dict(os.environ, {"XDG_CONFIG_HOME": "/fake/xdg"}, clear=True),
-        ):
-            result = get_config_dir()
-            assert result.parts[-2:] == ("xdg", APP_NAME)
-
-    def test_linux_fallback_uses_dot_config(self):
-        """Linux falls back to ~/.config when XDG_CONFIG_HOME not set."""
-        with patch("src.paths.sys.platform", "linux"), patch.dict(os.environ, {}, clear=True):
-            result = get_config_dir()
-            assert result.parts[-2:] == (".config", APP_NAME)
+    @pytest.mark.parametrize(
+        ("platform", "env", "expected_tail"),
+        [
+            # Windows reads APPDATA environment variable
+            ("win32", {"APPDATA": "/fake/appdata"}, ("appdata", APP_NAME)),
+            # Windows falls back to ~/AppData/Roaming when APPDATA not set
+            ("win32", {}, ("AppData", "Roaming", APP_NAME)),
+            # macOS uses ~/Library/Application Support
+            ("darwin", {}, ("Library", "Application Support", APP_NAME)),
+            # Linux reads XDG_CONFIG_HOME environment variable
+            ("linux", {"XDG_CONFIG_HOME": "/fake/xdg"}, ("xdg", APP_NAME)),
+            # Linux falls back to ~/.config when XDG_CONFIG_HOME not set
+            ("linux", {}, (".config", APP_NAME)),
+        ],
+        ids=["win-appdata", "win-fallback", "macos", "linux-xdg", "linux-fallback"],
+    )
+    def test_platform_config_dir(self, monkeypatch, platform, env, expected_tail):
+        """Config dir follows platform conventions and environment overrides."""
+        monkeypatch.setattr("src.paths.sys.platform", platform)
+        monkeypatch.delenv("APPDATA", raising=False)
+        monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+
+        # Walk up via .parent/.name instead of splitting the whole path into parts
+        result = get_config_dir()
+        for expected_name in reversed(expected_tail):
+            assert result.name == expected_name
+            result = result.parent
 
 
 class TestGetTokenPath:
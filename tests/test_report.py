@@ -15,6 +15,7 @@
     WatchedEpisode,
 )
 from src.report import (
+    CSV_FIELDS,
     generate_csv_report,
     generate_html_report,
     generate_unmapped_json,
@@ -195,6 +196,23 @@ def test_generate_csv_report_to_file(self, sample_anime_list, tmp_path):
         assert len(rows) == 3
         assert rows[0]["Title"]  # Has title column
 
+    def test_csv_report_empty_list_writes_header(self, tmp_path):
+        """CSV report for empty list still has a header row."""
+        output_path = tmp_path / "report.csv"
+        rows = generate_csv_report([], output_path=output_path)
+
+        assert rows == []
+        assert output_path.read_text().startswith("Title,Title (Romaji),")
+
+    def test_csv_report_rows_match_fields(self, sample_anime_list, sample_resolutions):
+        """Every row, including a fully populated one, has exactly the CSV columns."""
+        rows = generate_csv_report(sample_anime_list, sample_resolutions)
+
+        for row in rows:
+            assert list(row) == list(CSV_FIELDS)
+        aot_row = next(r for r in rows if r["AniDB ID"] == 11061)
+        assert aot_row["Trakt Rating"] == 8
+
     def test_csv_report_movie_ids(self, sample_anime_list):
         """CSV report includes TMDB ID for movies."""
         rows = generate_csv_report(sample_anime_list)
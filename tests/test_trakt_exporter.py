@@ -1,7 +1,7 @@
 """Tests for Trakt exporter."""
 
 import json
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
@@ -44,8 +44,7 @@ def mock_id_mapper(tmp_path):
             "tvdb_epoffset": 0,
         },
     }
-    with open(cache_path, "w") as f:
-        json.dump(mapping_data, f)
+    cache_path.write_text(json.dumps(mapping_data))
 
     mapper = IDMapper(cache_path=cache_path, auto_download=False)
     return mapper
@@ -117,6 +116,15 @@ def test_datetime_to_iso(self):
         result = datetime_to_iso(dt)
         assert result == "2023-04-15T20:30:00.000Z"
 
+    def test_datetime_to_iso_aware_converted_to_utc(self):
+        """Aware datetimes are formatted as their UTC instant."""
+        utc = datetime(2023, 4, 15, 20, 30, tzinfo=timezone.utc)
+        shifted = utc.astimezone(timezone(timedelta(hours=2)))
+
+        assert datetime_to_iso(utc) == "2023-04-15T20:30:00.000Z"
+        assert datetime_to_iso(shifted) == "2023-04-15T20:30:00.000Z"
+        assert iso_to_datetime(datetime_to_iso(shifted)) == datetime(2023, 4, 15, 20, 30)
+
     def test_datetime_to_iso_none(self):
         """None datetime returns None."""
         assert datetime_to_iso(None) is None
@@ -126,6 +134,21 @@ def test_iso_to_datetime(self):
         result = iso_to_datetime("2023-04-15T20:30:00.000Z")
         assert result == datetime(2023, 4, 15, 20, 30, 0)
 
+    def test_iso_to_datetime_offset_normalized_to_utc(self):
+        """Explicit offsets are converted to naive UTC."""
+        result = iso_to_datetime("2023-04-15T22:30:00+02:00")
+        assert result == datetime(2023, 4, 15, 20, 30, 0)
+        assert result.tzinfo is None
+
+    def test_iso_round_trip(self):
+        """datetime_to_iso output parses back to the same datetime."""
+        dt = datetime(2023, 4, 15, 20, 30, 0)
+        assert iso_to_datetime(datetime_to_iso(dt)) == dt
+
+    def test_iso_to_datetime_invalid(self):
+        """Invalid string returns None."""
+        assert iso_to_datetime("not a date") is None
+
     def test_iso_to_datetime_none(self):
         """None string returns None."""
         assert iso_to_datetime(None) is None
@@ -160,6 +183,21 @@ def test_generate_history_json_shows(self, mock_id_mapper, sample_anime_list):
         season_0 = next(s for s in show["seasons"] if s["number"] == 0)
         assert len(season_0["episodes"]) == 1
 
+    def test_generate_history_json_keeps_seasons_apart(
+        self, mock_id_mapper, sample_anime_list, monkeypatch
+    ):
+        """Episodes the mapper puts in different seasons stay in separate seasons."""
+        monkeypatch.setattr(
+            mock_id_mapper,
+            "map_episode_to_trakt",
+            lambda ep, ids: (0 if ep.is_special else ep.episode_number, 1),
+        )
+        exporter = TraktExporter(mock_id_mapper)
+        show = exporter.generate_history_json(sample_anime_list)["shows"][0]
+
+        assert [s["number"] for s in show["seasons"]] == [0, 1, 2]
+        assert all(len(s["episodes"]) == 1 for s in show["seasons"])
+
     def test_generate_history_json_movies(self, mock_id_mapper, sample_anime_list):
         """Generate history JSON for movies."""
         exporter = TraktExporter(mock_id_mapper)
@@ -241,6 +279,111 @@ def test_export_to_files(self, mock_id_mapper, sample_anime_list, tmp_path):
             ratings = json.load(f)
             assert "shows" in ratings or "movies" in ratings
 
+    def test_export_to_files_skips_unchanged(self, mock_id_mapper, sample_anime_list, tmp_path):
+        """Re-exporting identical data leaves existing files untouched."""
+        exporter = TraktExporter(mock_id_mapper)
+        output_dir = tmp_path / "output"
+
+        files = exporter.export_to_files(sample_anime_list, output_dir)
+        mtime = files["history"].stat().st_mtime_ns
+
+        files = exporter.export_to_files(sample_anime_list, output_dir)
+
+        assert files["history"].stat().st_mtime_ns == mtime
+        assert not list(output_dir.glob("*.tmp"))
+
+    def test_export_to_files_streaming(self, mock_id_mapper, sample_anime_list, tmp_path):
+        """Streamed export round-trips to the same data as the generators."""
+        exporter = TraktExporter(mock_id_mapper)
+
+        files = exporter.export_to_files_streaming(sample_anime_list, tmp_path / "output")
+
+        with open(files["history"]) as f:
+            assert json.load(f) == exporter.generate_history_json(sample_anime_list)
+        with open(files["ratings"]) as f:
+            assert json.load(f) == exporter.generate_ratings_json(sample_anime_list)
+
+    def test_export_to_files_streaming_movies_only(
+        self, mock_id_mapper, sample_anime_list, tmp_path
+    ):
+        """Streamed export handles a movies-only library."""
+        exporter = TraktExporter(mock_id_mapper)
+        movies = [a for a in sample_anime_list if a.is_movie]
+
+        files = exporter.export_to_files_streaming(movies, tmp_path / "output")
+
+        with open(files["history"]) as f:
+            assert json.load(f) == {"movies": exporter.generate_history_json(movies)["movies"]}
+
+    def test_export_to_files_streaming_failure_cleans_up(
+        self, mock_id_mapper, sample_anime_list, tmp_path, monkeypatch
+    ):
+        """A failure mid-export leaves no temporary file behind."""
+
+        def fail(ep, ids):
+            raise RuntimeError("mapping failed")
+
+        monkeypatch.setattr(mock_id_mapper, "map_episode_to_trakt", fail)
+        exporter = TraktExporter(mock_id_mapper)
+        output_dir = tmp_path / "output"
+
+        # Movie first so the file is already open when the show fails
+        with pytest.raises(RuntimeError):
+            exporter.export_to_files_streaming(sample_anime_list[::-1], output_dir)
+
+        assert not list(output_dir.iterdir())
+
+    def test_export_to_jsonl(self, mock_id_mapper, sample_anime_list, tmp_path):
+        """JSON Lines export reassembles to the same data as the generators."""
+        exporter = TraktExporter(mock_id_mapper)
+
+        files = exporter.export_to_jsonl(sample_anime_list, tmp_path / "output")
+
+        for key, expected in (
+            ("history", exporter.generate_history_json(sample_anime_list)),
+            ("ratings", exporter.generate_ratings_json(sample_anime_list)),
+        ):
+            merged: dict[str, list] = {}
+            with open(files[key]) as f:
+                for line in f:
+                    ((kind, entries),) = json.loads(line).items()
+                    merged.setdefault(kind, []).extend(entries)
+            assert merged == expected
+
+    def test_export_to_jsonl_failure_cleans_up(
+        self, mock_id_mapper, sample_anime_list, tmp_path, monkeypatch
+    ):
+        """A failure mid-export leaves no temporary file behind."""
+
+        def fail(ep, ids):
+            raise RuntimeError("mapping failed")
+
+        monkeypatch.setattr(mock_id_mapper, "map_episode_to_trakt", fail)
+        exporter = TraktExporter(mock_id_mapper)
+        output_dir = tmp_path / "output"
+
+        # Movie first so the file is already open when the show fails
+        with pytest.raises(RuntimeError):
+            exporter.export_to_jsonl(sample_anime_list[::-1], output_dir)
+
+        assert not list(output_dir.iterdir())
+
+    def test_export_to_jsonl_empty(self, mock_id_mapper, tmp_path):
+        """JSON Lines export writes nothing for an empty list."""
+        exporter = TraktExporter(mock_id_mapper)
+        output_dir = tmp_path / "output"
+
+        assert exporter.export_to_jsonl([], output_dir) == {}
+        assert not list(output_dir.iterdir())
+
+    def test_export_to_files_streaming_empty(self, mock_id_mapper, tmp_path):
+        """Streamed export writes nothing for an empty list."""
+        exporter = TraktExporter(mock_id_mapper)
+        output_dir = tmp_path / "output"
+
+        assert exporter.export_to_files_streaming([], output_dir) == {}
+        assert not list(output_dir.iterdir())
+
     def test_generate_history_empty_list(self, mock_id_mapper):
         """Generate history for empty list."""
         exporter = TraktExporter(mock_id_mapper)
@@ -288,11 +431,64 @@ def test_save_and_load_checkpoint(self, tmp_path):
         assert loaded.synced_history == [4, 5]
         assert loaded.errors == [{"error": "test"}]
 
+    def test_save_and_load_gzip_checkpoint(self, tmp_path):
+        """Checkpoints with a .gz suffix are compressed and load back."""
+        checkpoint_path = tmp_path / "checkpoint.json.gz"
+        checkpoint = SyncCheckpoint(
+            last_processed_index=3,
+            synced_ratings=list(range(100)),
+            timestamp=datetime(2023, 4, 15, 12, 0),
+        )
+
+        save_checkpoint(checkpoint, checkpoint_path)
+        assert checkpoint_path.read_bytes()[:2] == b"\x1f\x8b"
+
+        loaded = load_checkpoint(checkpoint_path)
+        assert loaded is not None
+        assert loaded.last_processed_index == 3
+        assert loaded.synced_ratings == list(range(100))
+        assert loaded.timestamp == datetime(2023, 4, 15, 12, 0)
+
+    def test_load_truncated_gzip_checkpoint(self, tmp_path):
+        """Load returns None for a truncated gzip file."""
+        checkpoint_path = tmp_path / "checkpoint.json.gz"
+        save_checkpoint(SyncCheckpoint(), checkpoint_path)
+        checkpoint_path.write_bytes(checkpoint_path.read_bytes()[:10])
+
+        assert load_checkpoint(checkpoint_path) is None
+
+    def test_load_corrupt_gzip_checkpoint(self, tmp_path):
+        """Load returns None when the gzip body is corrupt."""
+        checkpoint_path = tmp_path / "checkpoint.json.gz"
+        save_checkpoint(SyncCheckpoint(), checkpoint_path)
+        raw = bytearray(checkpoint_path.read_bytes())
+        # Gzip header is 10 bytes; 0xff bytes start an invalid deflate block
+        raw[10:12] = b"\xff\xff"
+        checkpoint_path.write_bytes(bytes(raw))
+
+        assert load_checkpoint(checkpoint_path) is None
+
     def test_load_nonexistent_checkpoint(self, tmp_path):
         """Load returns None for nonexistent file."""
         checkpoint_path = tmp_path / "nonexistent.json"
         assert load_checkpoint(checkpoint_path) is None
 
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "[1, 2, 3]",
+            '{"timestamp": 5}',
+            '{"synced_ratings": null}',
+            '{"errors": {}}',
+            '{"last_processed_index": "3"}',
+        ],
+    )
+    def test_load_non_object_checkpoint(self, tmp_path, content):
+        """Load returns None for valid JSON that doesn't have checkpoint field types."""
+        checkpoint_path = tmp_path / "checkpoint.json"
+        checkpoint_path.write_text(content)
+        assert load_checkpoint(checkpoint_path) is None
+
     def test_load_invalid_checkpoint(self, tmp_path):
         """Load returns None for invalid JSON."""
         checkpoint_path = tmp_path / "invalid.json"
@@ -378,3 +574,28 @@ def test_conflict_indicator_keep_trakt(self, mock_id_mapper):
         )
 
         assert resolution.conflict_indicator == "⏭️ Keep Trakt"
+
+    def test_conflict_indicator_no_conflict(self, mock_id_mapper):
+        """Conflict indicator when ratings agree, whichever side is kept."""
+        from src.models import ConflictResolution, TraktEntry
+
+        anime = AnimeEntry(
+            anidb_id=11061,
+            title="Test",
+            rating=AnimeRating(score=9),
+        )
+        mock_id_mapper.map_anime(anime)
+
+        resolution = ConflictResolution(
+            anime=anime,
+            trakt_entry=TraktEntry(
+                trakt_id=1,
+                title="Test",
+                ids={},
+                rating=9,
+            ),
+            keep_anidb_rating=False,
+            rating_conflict=False,
+        )
+
+        assert resolution.conflict_indicator == "✅ No conflict"
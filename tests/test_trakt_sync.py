@@ -0,0 +1,98 @@
+"""Tests for Trakt sync batching."""
+
+from unittest.mock import MagicMock
+
+from src.trakt_sync import BATCH_SIZE, TraktSyncer, _iter_batches
+
+
+def _items(prefix: str, count: int) -> list[dict]:
+    """Build placeholder payload items."""
+    return [{"ids": {prefix: i}} for i in range(count)]
+
+
+class TestIterBatches:
+    """Tests for _iter_batches helper."""
+
+    def test_empty_payload(self):
+        """Empty payload yields no batches."""
+        assert list(_iter_batches({})) == []
+
+    def test_shows_and_movies_share_batch(self):
+        """A partial show batch is topped up with movies."""
+        data = {"shows": _items("tvdb", 3), "movies": _items("tmdb", 2)}
+        batches = list(_iter_batches(data))
+
+        assert len(batches) == 1
+        assert len(batches[0]["shows"]) == 3
+        assert len(batches[0]["movies"]) == 2
+
+    def test_batch_size_respected(self):
+        """Batches never exceed the batch size across both types."""
+        data = {
+            "shows": _items("tvdb", BATCH_SIZE + 10),
+            "movies": _items("tmdb", BATCH_SIZE),
+        }
+        batches = list(_iter_batches(data))
+
+        assert len(batches) == 3
+        for batch in batches:
+            assert sum(len(v) for v in batch.values()) <= BATCH_SIZE
+        assert sum(len(b.get("shows", [])) for b in batches) == BATCH_SIZE + 10
+        assert sum(len(b.get("movies", [])) for b in batches) == BATCH_SIZE
+
+    def test_movies_only(self):
+        """Movie-only payloads don't emit an empty shows key."""
+        batches = list(_iter_batches({"movies": _items("tmdb", 2)}))
+        assert batches == [{"movies": _items("tmdb", 2)}]
+
+
+class TestTraktSyncer:
+    """Tests for TraktSyncer batching behaviour."""
+
+    def test_sync_history_combines_types(self):
+        """Shows and movies go out in a single history request."""
+        client = MagicMock()
+        client.sync_history.return_value = {"added": {"episodes": 3, "movies": 1}}
+        syncer = TraktSyncer(client, MagicMock())
+
+        history = {"shows": _items("tvdb", 1), "movies": _items("tmdb", 1)}
+        results = syncer.sync([], history_data=history, sync_ratings=False)
+
+        client.sync_history.assert_called_once_with(history)
+        assert results["history_added"] == 4
+
+    def test_dry_run_history_counts(self):
+        """Dry run counts episodes across seasons plus movies."""
+        client = MagicMock()
+        syncer = TraktSyncer(client, MagicMock())
+
+        history = {
+            "shows": [
+                {
+                    "ids": {"tvdb": 1},
+                    "seasons": [
+                        {"number": 1, "episodes": [{"number": 1}, {"number": 2}]},
+                        {"number": 0, "episodes": [{"number": 1}]},
+                    ],
+                }
+            ],
+            "movies": _items("tmdb", 2),
+        }
+        results = syncer.sync([], history_data=history, sync_ratings=False, dry_run=True)
+
+        client.sync_history.assert_not_called()
+        assert results["history_added"] == 5
+
+    def test_sync_ratings_batches(self):
+        """Ratings are split into batches without dropping items."""
+        client = MagicMock()
+        client.sync_ratings.return_value = {"added": {"shows": 0, "movies": 0}}
+        syncer = TraktSyncer(client, MagicMock())
+
+        ratings = {"shows": _items("tvdb", BATCH_SIZE + 1), "movies": _items("tmdb", 1)}
+        syncer.sync([], ratings_data=ratings, sync_history=False)
+
+        assert client.sync_ratings.call_count == 2
+        second = client.sync_ratings.call_args_list[1].args[0]
+        assert len(second["shows"]) == 1
+        assert len(second["movies"]) == 1